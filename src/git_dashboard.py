@@ -3,41 +3,105 @@
 Git Activity Dashboard - A CLI tool for visualizing git activity across repos.
 """
 
+__version__ = '1.0'
+
 import os
+import re
 import sys
-import argparse
 import subprocess
 import json
-from pathlib import Path
-from datetime import datetime, timedelta
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
 from collections import defaultdict
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+# Plain-text stand-ins until _init_colors() swaps in colorama (or if it's missing)
+class Fore:
+    CYAN = BLUE = GREEN = YELLOW = RED = MAGENTA = WHITE = ''
+
 
-try:
-    from git import Repo
-    from git.exc import InvalidGitRepositoryError
-except ImportError:
-    print("Error: GitPython not installed. Run: pip install GitPython")
-    sys.exit(1)
+class Style:
+    BRIGHT = DIM = RESET_ALL = ''
 
-try:
-    from colorama import init, Fore, Style
+
+# colorama is imported on first use so that `--help` and config loading
+# don't pay for it at startup
+def _init_colors():
+    """Enable colored output via colorama, keeping plain text if it's unavailable."""
+    global Fore, Style
+    try:
+        from colorama import init, Fore as _Fore, Style as _Style
+    except ImportError:
+        return
     init(autoreset=True)
-except ImportError:
-    # Fallback if colorama not installed
-    class Fore:
-        CYAN = BLUE = GREEN = YELLOW = RED = MAGENTA = WHITE = ''
-    class Style:
-        BRIGHT = DIM = RESET_ALL = ''
+    Fore, Style = _Fore, _Style
 
 
-def load_config(config_path: str = None) -> Dict:
-    """Load configuration from YAML file."""
+# Patterns for parsing `git log --shortstat` summary lines
+_FILES_RE = re.compile(r'(\d+) files? changed')
+_INSERTIONS_RE = re.compile(r'(\d+) insertions?\(\+\)')
+_DELETIONS_RE = re.compile(r'(\d+) deletions?\(-\)')
+
+# Location for caches derived from config files and repository stats
+CACHE_DIR = os.path.expanduser('~/.cache/git-dashboard')
+
+# Resolve git once rather than searching PATH on every subprocess call
+_GIT = shutil.which('git') or 'git'
+
+# git log format: hash, committer timestamp, author name, subject
+_LOG_FORMAT = '%H%x01%ct%x01%an%x01%s'
+
+# Cap on concurrent repo scans (each may spawn git subprocesses)
+MAX_WORKERS = 32
+
+
+def _write_cache(cache_path: str, data) -> None:
+    """Best-effort atomic JSON write so concurrent runs never see a partial file."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _load_yaml_cached(yaml_path: str) -> Dict:
+    """Load a YAML file, reusing a JSON copy of it while the YAML is unchanged."""
+    # Stat before reading so an edit made while we parse never matches
+    yaml_stat = os.stat(yaml_path)
+    source = {'mtime_ns': yaml_stat.st_mtime_ns, 'size': yaml_stat.st_size}
+    key = hashlib.blake2b(os.path.abspath(yaml_path).encode(), digest_size=16).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"config_{key}.json")
+    
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry.get('source') == source:
+            return entry['config']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
     import yaml
     
+    # Prefer the libyaml-backed loader when available
+    Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(yaml_path, 'r') as f:
+        config = yaml.load(f, Loader=Loader)
+    
+    _write_cache(cache_path, {'source': source, 'config': config})
+    return config
+
+
+def load_config(config_path: str = None) -> Dict:
+    """Load configuration from YAML file."""
     if config_path and os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return _load_yaml_cached(config_path)
     
     # Default config locations
     default_paths = [
@@ -48,8 +112,7 @@ def load_config(config_path: str = None) -> Dict:
     
     for path in default_paths:
         if os.path.exists(path):
-            with open(path, 'r') as f:
-                return yaml.safe_load(f)
+            return _load_yaml_cached(path)
     
     # Return default config
     return {
@@ -60,134 +123,227 @@ def load_config(config_path: str = None) -> Dict:
     }
 
 
-def find_git_repos(base_path: str, exclude_patterns: List[str], max_repos: int = 50) -> List[Path]:
-    """Recursively find git repositories."""
+def find_git_repos(base_path: str, exclude_patterns: List[str], max_repos: int = 50) -> List[str]:
+    """Recursively find git repositories, returning their paths as strings."""
     repos = []
-    base = Path(base_path).resolve()
+    base = os.path.realpath(base_path)
     
-    if not base.exists():
+    if not os.path.exists(base):
         return repos
     
-    # Convert exclude patterns to a set for faster lookup
-    exclude_set = set(exclude_patterns)
-    
-    for path in base.rglob('.git'):
-        repo_path = path.parent
-        
-        # Check if excluded - match exact directory names in path parts
-        path_parts = repo_path.parts
-        should_exclude = False
-        for part in path_parts:
-            if part in exclude_set:
-                should_exclude = True
-                break
-            # Also check if any pattern matches as substring in part
-            # (handles cases like .git, __pycache__, etc.)
-            for pattern in exclude_set:
-                if pattern in part:
-                    should_exclude = True
-                    break
-            if should_exclude:
-                break
-        
-        if should_exclude:
-            continue
-        
+    # Plain directory names (node_modules, .venv) are matched exactly with a
+    # set lookup; anything else is matched as a substring by one regex
+    exclude_exact = {p for p in exclude_patterns if p.isidentifier() or p.startswith('.')}
+    substring_patterns = [p for p in exclude_patterns if p not in exclude_exact]
+    exclude_re = re.compile('|'.join(map(re.escape, substring_patterns))) if substring_patterns else None
+    
+    # Depth-first walk that prunes excluded directories before descending
+    # into them and stops at the first directory containing a .git entry
+    stack = [base]
+    while stack and len(repos) < max_repos:
+        current = stack.pop()
         try:
-            Repo(repo_path)
-            repos.append(repo_path)
-            if len(repos) >= max_repos:
-                break
-        except InvalidGitRepositoryError:
+            entries = os.scandir(current)
+        except OSError:
             continue
+        
+        with entries:
+            children = []
+            for entry in entries:
+                if entry.name == '.git':
+                    # Cheap repo check without spawning git: a .git directory
+                    # needs a HEAD file, a .git file is a worktree/submodule link
+                    if entry.is_dir():
+                        is_repo = os.path.exists(os.path.join(entry.path, 'HEAD'))
+                    else:
+                        is_repo = entry.is_file()
+                    if is_repo:
+                        repos.append(current)
+                        children = None
+                        break
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name in exclude_exact:
+                    continue
+                if exclude_re and exclude_re.search(entry.name):
+                    continue
+                children.append(entry.path)
+        
+        if children:
+            stack.extend(children)
     
     return repos
 
 
-def get_commit_stats(repo_path: Path, days: int) -> Dict:
-    """Get commit statistics for a repository."""
+def _run_git(repo_path: str, *args: str) -> subprocess.CompletedProcess:
+    """Run a git command in a repository and capture its text output."""
+    # Our own descriptors are non-inheritable, so skipping close_fds is safe
+    # and avoids walking the whole descriptor table on every spawn
+    return subprocess.run(
+        [_GIT, '-C', repo_path, *args],
+        stdin=subprocess.DEVNULL, capture_output=True, close_fds=False,
+        text=True, encoding='utf-8', errors='replace'
+    )
+
+
+def _window_line_stats(repo_path: str, since_str: str) -> Optional[Tuple[int, int, int]]:
+    """Sum files changed, insertions and deletions over all commits since a date.
+    
+    Returns None if git fails, so callers can tell an error from an empty window.
+    """
+    files_changed = 0
+    insertions = 0
+    deletions = 0
+    
+    # One git invocation for the whole window instead of one per commit
+    result = _run_git(repo_path, 'log', f'--since={since_str}', '--shortstat', '--pretty=tformat:')
+    if result.returncode != 0:
+        return None
+    
+    for line in result.stdout.splitlines():
+        match = _FILES_RE.search(line)
+        if not match:
+            continue
+        files_changed += int(match.group(1))
+        match = _INSERTIONS_RE.search(line)
+        if match:
+            insertions += int(match.group(1))
+        match = _DELETIONS_RE.search(line)
+        if match:
+            deletions += int(match.group(1))
+    
+    return files_changed, insertions, deletions
+
+
+def _load_cached_stats(cache_path: str, cache_key: List) -> Dict:
+    """Return cached stats if they were stored under the same key, else None."""
     try:
-        repo = Repo(repo_path)
-    except InvalidGitRepositoryError:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if entry.get('key') != cache_key:
         return None
     
-    since_date = datetime.now() - timedelta(days=days)
-    since_str = since_date.strftime('%Y-%m-%d')
+    stats = entry['stats']
+    for commit in stats['commits']:
+        commit['date'] = datetime.fromtimestamp(commit['date'])
+    return stats
+
+
+def _save_cached_stats(cache_path: str, cache_key: List, stats: Dict) -> None:
+    """Store stats under a key, with commit dates as timestamps for JSON."""
+    commits = [dict(commit, date=commit['date'].timestamp()) for commit in stats['commits']]
+    _write_cache(cache_path, {'key': cache_key, 'stats': dict(stats, commits=commits)})
+
+
+def get_commit_stats(repo_path: str, days: int) -> Dict:
+    """Get commit statistics for a repository."""
+    # The window is today plus the previous days - 1 calendar days, starting
+    # at local midnight so results for a given HEAD only change when the day
+    # does, which keeps the stats cache exact
+    since_date = (datetime.now() - timedelta(days=days - 1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    since_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Resolving HEAD doubles as the validity check; if it fails, a repo
+    # without commits yet is still reported (with zero activity, uncached)
+    head = _run_git(repo_path, 'rev-parse', 'HEAD')
+    if head.returncode != 0 and _run_git(repo_path, 'rev-parse', '--git-dir').returncode != 0:
+        return None
+    
+    # Reuse stats from a previous run when nothing has been committed since
+    cache_key = [repo_path, days, since_str, head.stdout.strip()] if head.returncode == 0 else None
+    if cache_key:
+        key = hashlib.blake2b(f"{repo_path}\0{days}".encode(), digest_size=16).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, f"stats_{key}.json")
+        cached = _load_cached_stats(cache_path, cache_key)
+        if cached is not None:
+            return cached
     
     commits = []
+    total_commits = 0
     files_changed = 0
     insertions = 0
     deletions = 0
-    daily_commits = defaultdict(int)
-    
+    # Per-day counts, oldest first (index days - 1 is today). Days are bounded
+    # by real local midnights so DST changes inside the window don't shift
+    # commits into a neighbouring day.
+    since_day = since_date.date()
+    day_starts = [datetime.combine(since_day + timedelta(days=n), time.min).timestamp()
+                  for n in range(days + 1)]
+    daily_counts = [0] * days
+    
+    # Only results where every git call succeeded are cached, so a failure
+    # is retried on the next run instead of being served until HEAD moves
+    complete = False
     try:
-        for commit in repo.iter_commits('HEAD', since=since_str):
-            commit_date = datetime.fromtimestamp(commit.committed_date)
-            commits.append({
-                'hash': commit.hexsha[:8],
-                'message': commit.message.strip(),
-                'author': str(commit.author),
-                'date': commit_date,
-            })
-            daily_commits[commit_date.strftime('%Y-%m-%d')] += 1
+        # One git log call streams every commit in the window, newest first
+        result = _run_git(repo_path, 'log', 'HEAD', f'--since={since_str}', f'--pretty=format:{_LOG_FORMAT}')
+        complete = result.returncode == 0
+        if result.returncode == 0 and result.stdout:
+            for line in result.stdout.split('\n'):
+                sha, timestamp, author, subject = line.split('\x01', 3)
+                timestamp = int(timestamp)
+                # Only the commits that are kept get a datetime; every commit
+                # is bucketed from its epoch timestamp against day_starts
+                if total_commits < 10:
+                    commits.append({
+                        'hash': sha[:8],
+                        'message': subject,
+                        'author': author,
+                        'date': datetime.fromtimestamp(timestamp),
+                    })
+                total_commits += 1
+                offset = bisect_right(day_starts, timestamp) - 1
+                if 0 <= offset < days:
+                    daily_counts[offset] += 1
         
-        # Get diff stats if we have commits
-        if commits:
+        # Get diff stats for the whole window if we have commits
+        if total_commits:
             try:
-                # Get stats from the last commit
-                latest_commit = repo.head.commit
-                if latest_commit.parents:
-                    diff = latest_commit.parents[0].diff(latest_commit, create_patch=False)
-                    files_changed = sum(1 for _ in diff)
-                    
-                    # Get line stats using git show --stat
-                    result = subprocess.run(
-                        ['git', '-C', str(repo_path), 'show', '--stat', '--oneline', 'HEAD'],
-                        capture_output=True, text=True
-                    )
-                    if result.returncode == 0:
-                        # Parse the stat output
-                        lines = result.stdout.strip().split('\n')
-                        if lines:
-                            last_line = lines[-1]
-                            if 'insertion' in last_line or 'deletion' in last_line:
-                                parts = last_line.split(',')
-                                for part in parts:
-                                    if 'insertion' in part:
-                                        insertions = int(part.strip().split()[0])
-                                    elif 'deletion' in part:
-                                        deletions = int(part.strip().split()[0])
+                line_stats = _window_line_stats(repo_path, since_str)
             except Exception:
-                pass
+                line_stats = None
+            if line_stats is None:
+                complete = False
+            else:
+                files_changed, insertions, deletions = line_stats
     
     except Exception as e:
-        pass
+        complete = False
     
-    return {
-        'name': repo_path.name,
-        'path': str(repo_path),
-        'total_commits': len(commits),
+    # Date-keyed view for the JSON export; only days with commits are formatted
+    daily_commits = {
+        (since_day + timedelta(days=offset)).isoformat(): count
+        for offset, count in enumerate(daily_counts) if count
+    }
+    
+    stats = {
+        'name': os.path.basename(repo_path),
+        'path': repo_path,
+        'total_commits': total_commits,
         'files_changed': files_changed,
         'insertions': insertions,
         'deletions': deletions,
-        'commits': commits[:10],  # Last 10 commits
-        'daily_commits': dict(daily_commits),
+        'commits': commits,  # Last 10 commits
+        'daily_commits': daily_commits,
+        'daily_counts': daily_counts,
     }
+    
+    if cache_key and complete:
+        _save_cached_stats(cache_path, cache_key, stats)
+    return stats
 
 
-def draw_bar_chart(daily_data: Dict[str, int], days: int) -> str:
-    """Draw an ASCII bar chart of daily activity."""
-    if not daily_data:
+def draw_bar_chart(daily_counts: List[int], days: int) -> str:
+    """Draw an ASCII bar chart of daily activity (counts ordered oldest first)."""
+    if not daily_counts:
         return "  No activity data available."
     
-    # Generate date range
-    dates = []
-    for i in range(days - 1, -1, -1):
-        date_str = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-        dates.append(date_str)
-    
     # Get values for the range
-    values = [daily_data.get(d, 0) for d in dates]
+    values = daily_counts[-days:]
     
     if not values or max(values) == 0:
         return "  No commits in this period."
@@ -199,34 +355,35 @@ def draw_bar_chart(daily_data: Dict[str, int], days: int) -> str:
     
     # Header
     lines.append(f"\n{Fore.CYAN}{Style.BRIGHT}  Daily Activity (Last {days} Days){Style.RESET_ALL}")
-    lines.append(f"  {Fore.DIM}{'─' * 60}{Style.RESET_ALL}")
+    lines.append(f"  {Style.DIM}{'─' * 60}{Style.RESET_ALL}")
     
-    # Chart area
+    # Chart area - format the glyphs once and join each row in one pass.
+    # Each column's bar height is computed once in integer arithmetic, so
+    # a row only compares small ints instead of rescaling every value.
+    bar = f"{Fore.GREEN}█{Style.RESET_ALL}"
+    heights = [val * chart_height // max_val for val in values[-14:]]  # Show last 14 days for width
     for i in range(chart_height, 0, -1):
-        threshold = (i / chart_height) * max_val
-        line = f"  {Fore.DIM}{i * max_val // chart_height:3d} │{Style.RESET_ALL}"
-        for val in values[-14:]:  # Show last 14 days for width
-            if val >= threshold:
-                line += f"{Fore.GREEN}█{Style.RESET_ALL}"
-            else:
-                line += " "
-        lines.append(line)
+        label = f"  {Style.DIM}{i * max_val // chart_height:3d} │{Style.RESET_ALL}"
+        lines.append(label + ''.join(bar if height >= i else ' ' for height in heights))
     
     # X-axis
-    lines.append(f"  {Fore.DIM}    └{'─' * min(len(values), 14)}{Style.RESET_ALL}")
+    lines.append(f"  {Style.DIM}    └{'─' * min(len(values), 14)}{Style.RESET_ALL}")
     
-    # Date labels (show first and last)
-    if len(dates) >= 14:
-        first_date = dates[-14]
-        last_date = dates[-1]
-        lines.append(f"  {Fore.DIM}     {first_date}  →  {last_date}{Style.RESET_ALL}")
+    # Date labels (show first and last) - only these two dates are formatted
+    if days >= 14:
+        today = date.today().toordinal()
+        first_date = date.fromordinal(today - 13).isoformat()
+        last_date = date.fromordinal(today).isoformat()
+        lines.append(f"  {Style.DIM}     {first_date}  →  {last_date}{Style.RESET_ALL}")
     
     return '\n'.join(lines)
 
 
-def format_stat(label: str, value: int, color: str = Fore.WHITE) -> str:
+def format_stat(label: str, value: int, color: str = None) -> str:
     """Format a statistic line."""
-    return f"  {Fore.DIM}{label:20s}{Style.RESET_ALL} {color}{Style.BRIGHT}{value:>8d}{Style.RESET_ALL}"
+    if color is None:
+        color = Fore.WHITE
+    return f"  {Style.DIM}{label:20s}{Style.RESET_ALL} {color}{Style.BRIGHT}{value:>8d}{Style.RESET_ALL}"
 
 
 def export_to_json(stats_list: List[Dict], days: int, output_dir: str = None) -> str:
@@ -249,8 +406,8 @@ def export_to_json(stats_list: List[Dict], days: int, output_dir: str = None) ->
     # Aggregate daily activity across all repos
     all_daily = defaultdict(int)
     for stat in stats_list:
-        for date, count in stat['daily_commits'].items():
-            all_daily[date] += count
+        for day, count in stat['daily_commits'].items():
+            all_daily[day] += count
     
     # Calculate file changes totals
     total_files_changed = sum(s['files_changed'] for s in stats_list)
@@ -292,7 +449,7 @@ def export_to_json(stats_list: List[Dict], days: int, output_dir: str = None) ->
         'metadata': {
             'generated_at': datetime.now().isoformat(),
             'analysis_period_days': days,
-            'version': '1.0'
+            'version': __version__
         },
         'summary': {
             'repositories_scanned': total_repos,
@@ -307,58 +464,68 @@ def export_to_json(stats_list: List[Dict], days: int, output_dir: str = None) ->
         'repositories': repositories
     }
     
-    # Write JSON file with nice formatting
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+    # Write JSON file with nice formatting, using orjson when installed
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(export_data, f, indent=2, ensure_ascii=False)
     
     return filepath
 
 
 def display_dashboard(stats_list: List[Dict], days: int):
     """Display the activity dashboard."""
+    # Collect every line and emit them with a single write at the end
+    lines = []
+    out = lines.append
+    
     # Header
-    print(f"\n{Fore.CYAN}{'═' * 70}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{Style.BRIGHT}{'🔥 GIT ACTIVITY DASHBOARD':^70s}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'═' * 70}{Style.RESET_ALL}\n")
+    out(f"\n{Fore.CYAN}{'═' * 70}{Style.RESET_ALL}")
+    out(f"{Fore.CYAN}{Style.BRIGHT}{'🔥 GIT ACTIVITY DASHBOARD':^70s}{Style.RESET_ALL}")
+    out(f"{Fore.CYAN}{'═' * 70}{Style.RESET_ALL}\n")
     
     # Summary stats
     total_commits = sum(s['total_commits'] for s in stats_list)
     total_repos = len(stats_list)
     active_repos = sum(1 for s in stats_list if s['total_commits'] > 0)
     
-    print(f"{Fore.YELLOW}{Style.BRIGHT}📊 SUMMARY{Style.RESET_ALL}")
-    print(f"  {Fore.DIM}{'─' * 40}{Style.RESET_ALL}")
-    print(format_stat("Repositories scanned:", total_repos, Fore.CYAN))
-    print(format_stat("Active repositories:", active_repos, Fore.GREEN))
-    print(format_stat(f"Total commits ({days} days):", total_commits, Fore.YELLOW))
-    print()
+    out(f"{Fore.YELLOW}{Style.BRIGHT}📊 SUMMARY{Style.RESET_ALL}")
+    out(f"  {Style.DIM}{'─' * 40}{Style.RESET_ALL}")
+    out(format_stat("Repositories scanned:", total_repos, Fore.CYAN))
+    out(format_stat("Active repositories:", active_repos, Fore.GREEN))
+    out(format_stat(f"Total commits ({days} days):", total_commits, Fore.YELLOW))
+    out('')
     
     # Per-repo stats
-    print(f"{Fore.YELLOW}{Style.BRIGHT}📁 REPOSITORY BREAKDOWN{Style.RESET_ALL}")
-    print(f"  {Fore.DIM}{'─' * 60}{Style.RESET_ALL}")
-    print(f"  {'Repository':<25} {'Commits':>8} {'Files':>8} {'+/-':>12}")
-    print(f"  {Fore.DIM}{'─' * 60}{Style.RESET_ALL}")
+    out(f"{Fore.YELLOW}{Style.BRIGHT}📁 REPOSITORY BREAKDOWN{Style.RESET_ALL}")
+    out(f"  {Style.DIM}{'─' * 60}{Style.RESET_ALL}")
+    out(f"  {'Repository':<25} {'Commits':>8} {'Files':>8} {'+/-':>12}")
+    out(f"  {Style.DIM}{'─' * 60}{Style.RESET_ALL}")
     
     # Sort by commit count
     sorted_stats = sorted(stats_list, key=lambda x: x['total_commits'], reverse=True)
     
     for stat in sorted_stats:
         if stat['total_commits'] > 0:
-            color = Fore.GREEN if stat['total_commits'] > 5 else Fore.YELLOW if stat['total_commits'] > 0 else Fore.DIM
+            color = Fore.GREEN if stat['total_commits'] > 5 else Fore.YELLOW if stat['total_commits'] > 0 else Style.DIM
             changes = f"+{stat['insertions']}/-{stat['deletions']}"
-            print(f"  {color}{stat['name']:<25}{Style.RESET_ALL} {stat['total_commits']:>8} {stat['files_changed']:>8} {Fore.CYAN}{changes:>12}{Style.RESET_ALL}")
+            out(f"  {color}{stat['name']:<25}{Style.RESET_ALL} {stat['total_commits']:>8} {stat['files_changed']:>8} {Fore.CYAN}{changes:>12}{Style.RESET_ALL}")
     
-    # Aggregate daily activity chart
-    all_daily = defaultdict(int)
-    for stat in stats_list:
-        for date, count in stat['daily_commits'].items():
-            all_daily[date] += count
+    # Aggregate daily activity chart - sum the per-repo day columns
+    all_daily = [sum(counts) for counts in zip(*(s['daily_counts'] for s in stats_list))]
     
-    print(draw_bar_chart(all_daily, days))
+    out(draw_bar_chart(all_daily, days))
     
     # Recent commits
-    print(f"\n{Fore.YELLOW}{Style.BRIGHT}📝 RECENT COMMITS{Style.RESET_ALL}")
-    print(f"  {Fore.DIM}{'─' * 60}{Style.RESET_ALL}")
+    out(f"\n{Fore.YELLOW}{Style.BRIGHT}📝 RECENT COMMITS{Style.RESET_ALL}")
+    out(f"  {Style.DIM}{'─' * 60}{Style.RESET_ALL}")
     
     all_commits = []
     for stat in stats_list:
@@ -371,13 +538,22 @@ def display_dashboard(stats_list: List[Dict], days: int):
     
     for commit in all_commits[:15]:  # Show last 15 commits
         date_str = commit['date'].strftime('%m/%d %H:%M')
-        message = commit['message'].split('\n')[0][:40]  # First line, truncated
-        print(f"  {Fore.DIM}{date_str}{Style.RESET_ALL} {Fore.CYAN}{commit['repo']:<15}{Style.RESET_ALL} {Fore.WHITE}{message}{Style.RESET_ALL}")
+        message = commit['message'][:40]  # Subject line, truncated
+        out(f"  {Style.DIM}{date_str}{Style.RESET_ALL} {Fore.CYAN}{commit['repo']:<15}{Style.RESET_ALL} {Fore.WHITE}{message}{Style.RESET_ALL}")
+    
+    out(f"\n{Fore.CYAN}{'═' * 70}{Style.RESET_ALL}\n")
     
-    print(f"\n{Fore.CYAN}{'═' * 70}{Style.RESET_ALL}\n")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
+    # Answer a bare --version before paying for argparse
+    if sys.argv[1:] == ['--version']:
+        print(f"git-dashboard {__version__}")
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Git Activity Dashboard - Visualize git activity across repositories',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -389,6 +565,7 @@ Examples:
   python src/git_dashboard.py --export-json      # Export data to JSON
         '''
     )
+    parser.add_argument('--version', action='version', version=f'git-dashboard {__version__}')
     parser.add_argument('-p', '--path', help='Directory to scan for git repositories')
     parser.add_argument('-d', '--days', type=int, default=30, help='Number of days to analyze (default: 30)')
     parser.add_argument('-c', '--config', help='Path to config file')
@@ -401,6 +578,7 @@ Examples:
                         help='Load exclude patterns from config file (default: True, use --no-exclude-from-config to disable)')
     
     args = parser.parse_args()
+    _init_colors()
     
     # Load config
     config = load_config(args.config)
@@ -449,12 +627,15 @@ Examples:
     
     print(f"{Fore.GREEN}Found {len(all_repos)} repositories{Style.RESET_ALL}")
     
-    # Analyze each repo
-    stats_list = []
-    for repo_path in all_repos:
-        stats = get_commit_stats(repo_path, days)
-        if stats:
-            stats_list.append(stats)
+    # Fail before any work if there is no git executable to run
+    if shutil.which(_GIT) is None:
+        print(f"{Fore.RED}Error: git not found. Install git and make sure it is on PATH.{Style.RESET_ALL}")
+        sys.exit(1)
+    
+    # Analyze repos concurrently - the work is dominated by blocking git I/O
+    max_workers = min(MAX_WORKERS, len(all_repos))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        stats_list = [s for s in executor.map(lambda p: get_commit_stats(p, days), all_repos) if s]
     
     # Display dashboard
     display_dashboard(stats_list, days)